@@ -1,2 +1,76 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from rdkit import Chem, DataStructs
+
+CHUNK_SIZE = 256
+
+_executor = None
+
+
+@lru_cache(maxsize=100_000)
+def _mol_from_smiles(smiles):
+    """Parse SMILES once and reuse the Mol for repeated searches."""
+    return Chem.MolFromSmiles(smiles)
+
+
+@lru_cache(maxsize=100_000)
+def _pattern_fingerprint(smiles):
+    """Pattern fingerprint used to screen candidates before atom matching.
+
+    Every bit set for a substructure is also set for any molecule that
+    contains it, so a missing bit rules the candidate out cheaply.
+    """
+    return Chem.PatternFingerprint(_mol_from_smiles(smiles))
+
+
+def _get_executor():
+    """Create the shared thread pool on first use.
+
+    Threads are enough here: RDKit releases the GIL while matching.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _executor
+
+
+def _match_chunk(chunk, substructure, query_fp):
+    result = []
+    for smiles in chunk:
+        molecule = _mol_from_smiles(smiles)
+        if molecule is None:
+            continue
+        if not DataStructs.AllProbeBitsMatch(query_fp, _pattern_fingerprint(smiles)):
+            continue
+        if molecule.HasSubstructMatch(substructure):
+            result.append(smiles)
+    return result
+
+
 def substructure_search(mols, mol):
-    pass
\ No newline at end of file
+    """Return the SMILES from `mols` whose molecules contain `mol`.
+
+    The substructure is parsed once up front; an invalid substructure
+    SMILES raises ValueError, invalid entries in `mols` are skipped.
+    Inputs longer than CHUNK_SIZE are matched in parallel, chunk by chunk,
+    keeping the original order.
+    """
+    substructure = _mol_from_smiles(mol)
+    if substructure is None:
+        raise ValueError(f"Invalid SMILES: {mol}")
+    query_fp = _pattern_fingerprint(mol)
+
+    mols = list(mols)
+    if len(mols) <= CHUNK_SIZE:
+        return _match_chunk(mols, substructure, query_fp)
+
+    chunks = [mols[i:i + CHUNK_SIZE] for i in range(0, len(mols), CHUNK_SIZE)]
+    matches = _get_executor().map(
+        _match_chunk,
+        chunks,
+        [substructure] * len(chunks),
+        [query_fp] * len(chunks),
+    )
+    return [smiles for chunk in matches for smiles in chunk]